@@ -1,14 +1,87 @@
 import datetime
-
-from collections import OrderedDict
+import functools
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.encoding import force_str
 
 from django_remote_forms import logger, widgets
-from django import forms
+# CommaSeparatedField lives in its own module so that this one can be
+# compiled with mypyc, but it stays importable from here
+from django_remote_forms.form_fields import CommaSeparatedField  # noqa: F401
 
 DEFAULT_REMOTE_WIDGET_CLASS_NAME = 'DefaultRemoteInput'
 
+# Remote widget classes keyed by the Django widget class they serialize,
+# filled in the first time a widget class is seen.
+_REMOTE_WIDGET_BY_CLASS: Dict[type, Type[widgets.RemoteWidget]] = {}
+
+
+def get_remote_widget_class(widget_class: type) -> Type[widgets.RemoteWidget]:
+    """
+    Returns the Remote Forms equivalent of a Django widget class, falling
+    back to the default remote input when there is none.
+    """
+    try:
+        return _REMOTE_WIDGET_BY_CLASS[widget_class]
+    except KeyError:
+        pass
+
+    # Widgets without a remote equivalent are expected and get the default
+    # remote input. This only runs once per widget class.
+    remote_widget_class_name = 'Remote%s' % widget_class.__name__
+    remote_widget_class = getattr(widgets, remote_widget_class_name, None)
+    if remote_widget_class is None:
+        logger.debug('No %s widget, using %s', remote_widget_class_name, DEFAULT_REMOTE_WIDGET_CLASS_NAME)
+        remote_widget_class = getattr(widgets, DEFAULT_REMOTE_WIDGET_CLASS_NAME)
+
+    _REMOTE_WIDGET_BY_CLASS[widget_class] = remote_widget_class
+    return remote_widget_class
+
+
+# Kind of default input formats used for each type of initial value
+_INITIAL_FMT_BY_TYPE = {
+    datetime.datetime: 'datetime',
+    datetime.date: 'date',
+    datetime.time: 'time',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _get_initial_format_kind(value_type: type) -> Optional[str]:
+    """
+    Returns the kind of input formats for values of the given type, or None
+    if it isn't a date, time or datetime type.
+
+    The MRO is walked so that subclasses are classified by their closest
+    base, which keeps datetimes from being taken for dates. The result is
+    cached per type.
+    """
+    for klass in value_type.__mro__:
+        kind = _INITIAL_FMT_BY_TYPE.get(klass)
+        if kind is not None:
+            return kind
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_input_formats(kind: str) -> Any:
+    """
+    Returns the input formats from settings for 'date', 'time' or 'datetime'
+    values, read once per kind.
+    """
+    return getattr(settings, '%s_INPUT_FORMATS' % kind.upper())
+
+
+@receiver(setting_changed)
+def _reset_default_input_formats(*, setting, **kwargs):
+    # Like Django's own format caches, forget the cached input formats when
+    # they change, e.g. under override_settings
+    if setting in {'DATE_INPUT_FORMATS', 'TIME_INPUT_FORMATS', 'DATETIME_INPUT_FORMATS'}:
+        _get_default_input_formats.cache_clear()
+
 
 class RemoteField(object):
     """
@@ -22,324 +95,266 @@ class RemoteField(object):
     https://docs.djangoproject.com/en/dev/ref/forms/api/#dynamic-initial-values
     """
 
-    def __init__(self, field, form_initial_data=None, field_name=None):
+    __slots__ = ('field_name', 'field', 'form_initial_data')
+
+    # Field attributes copied as-is into the dictionary, on top of the ones
+    # declared by parent classes.
+    _extra_attrs: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, field: Any, form_initial_data: Any = None,
+                 field_name: Optional[str] = None) -> None:
         self.field_name = field_name
         self.field = field
         self.form_initial_data = form_initial_data
 
-    def as_dict(self):
-        field_dict = OrderedDict()
-        field_dict['title'] = self.field.__class__.__name__
-        field_dict['required'] = self.field.required
-        field_dict['label'] = self.field.label
-        field_dict['initial'] = self.form_initial_data or self.field.initial
-        field_dict['help_text'] = self.field.help_text
-        field_dict['disabled'] = self.field.disabled
-
-        field_dict['error_messages'] = self.field.error_messages
-
-        # Instantiate the Remote Forms equivalent of the widget if possible
-        # in order to retrieve the widget contents as a dictionary.
-        remote_widget_class_name = 'Remote%s' % self.field.widget.__class__.__name__
-        try:
-            remote_widget_class = getattr(widgets, remote_widget_class_name)
-        except Exception as e:
-            logger.warning('Error serializing %s: %s', remote_widget_class_name, str(e))
-            remote_widget_class = getattr(widgets, DEFAULT_REMOTE_WIDGET_CLASS_NAME)
-
-        remote_widget = remote_widget_class(self.field.widget, field_name=self.field_name)
-        widget_dict = remote_widget.as_dict()
-
-        field_dict['widget'] = widget_dict
+    def as_dict(self, include_widget: bool = True) -> dict:
+        """
+        Returns the field as a dictionary. Callers that don't need the widget
+        description can pass include_widget=False to skip building it.
+        """
+        field = self.field
+
+        field_dict = {}
+        field_dict['title'] = field.__class__.__name__
+        field_dict['required'] = field.required
+        field_dict['label'] = force_str(field.label, strings_only=True)
+        # Evaluate callable initial values once, as Django's BoundField does,
+        # so subclasses always get the actual value.
+        initial = self.form_initial_data or field.initial
+        if callable(initial):
+            initial = initial()
+        field_dict['initial'] = initial
+        field_dict['help_text'] = force_str(field.help_text, strings_only=True)
+        field_dict['disabled'] = field.disabled
+
+        # Resolve lazy translations here so the dictionary only holds plain
+        # strings by the time it gets serialized
+        field_dict['error_messages'] = {
+            key: force_str(message) for key, message in field.error_messages.items()
+        }
+
+        if include_widget:
+            # Use the Remote Forms equivalent of the widget if possible in
+            # order to retrieve the widget contents as a dictionary.
+            widget = field.widget
+            remote_widget_class = get_remote_widget_class(type(widget))
+            field_dict['widget'] = remote_widget_class.build_dict(widget, field_name=self.field_name)
+
+        for attr in self._field_attr_spec():
+            field_dict[attr] = getattr(field, attr)
+
+        for post in self._post_processors():
+            post(self, field_dict)
 
         return field_dict
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _field_attr_spec(cls) -> tuple:
+        """
+        Returns the names of the extra field attributes serialized by this
+        class and its parents, computed once per class.
+        """
+        spec = []
+        for klass in reversed(cls.__mro__):
+            for attr in vars(klass).get('_extra_attrs', ()):
+                if attr not in spec:
+                    spec.append(attr)
+        return tuple(spec)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _post_processors(cls) -> tuple:
+        """
+        Returns the _post(self, field_dict) methods defined by this class and
+        its parents, base class first, computed once per class.
+
+        Subclasses adjust the field dictionary through _post instead of
+        overriding as_dict, and never need to call their parent's.
+        """
+        return tuple(
+            vars(klass)['_post'] for klass in reversed(cls.__mro__) if '_post' in vars(klass)
+        )
 
-class RemoteCharField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteCharField, self).as_dict()
-
-        field_dict.update({
-            'max_length': self.field.max_length,
-            'min_length': self.field.min_length
-        })
 
-        return field_dict
+class RemoteCharField(RemoteField):
+    __slots__ = ()
+    _extra_attrs = ('max_length', 'min_length')
 
 
 class RemoteIntegerField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteIntegerField, self).as_dict()
-
-        field_dict.update({
-            'max_value': self.field.max_value,
-            'min_value': self.field.min_value
-        })
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('max_value', 'min_value')
 
 
 class RemoteFloatField(RemoteIntegerField):
-    def as_dict(self):
-        return super(RemoteFloatField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteDecimalField(RemoteIntegerField):
-    def as_dict(self):
-        field_dict = super(RemoteDecimalField, self).as_dict()
-
-        field_dict.update({
-            'max_digits': self.field.max_digits,
-            'decimal_places': self.field.decimal_places
-        })
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('max_digits', 'decimal_places')
 
 
 class RemoteTimeField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteTimeField, self).as_dict()
+    __slots__ = ()
 
-        field_dict['input_formats'] = self.field.input_formats
-
-        if (field_dict['initial']):
-            if callable(field_dict['initial']):
-                field_dict['initial'] = field_dict['initial']()
+    def _post(self, field_dict: dict) -> None:
+        # Input formats may be a lazy list or an iterator such as Django's
+        # DateTimeFormatsIterator, neither of which can be serialized as is
+        input_formats = list(self.field.input_formats)
+        initial = field_dict['initial']
 
+        if initial:
             # If initial value is datetime then convert it using first available input format
-            if (isinstance(field_dict['initial'], (datetime.datetime, datetime.time, datetime.date))):
-                if not len(field_dict['input_formats']):
-                    if isinstance(field_dict['initial'], datetime.date):
-                        field_dict['input_formats'] = settings.DATE_INPUT_FORMATS
-                    elif isinstance(field_dict['initial'], datetime.time):
-                        field_dict['input_formats'] = settings.TIME_INPUT_FORMATS
-                    elif isinstance(field_dict['initial'], datetime.datetime):
-                        field_dict['input_formats'] = settings.DATETIME_INPUT_FORMATS
-
-                input_format = field_dict['input_formats'][0]
-                field_dict['initial'] = field_dict['initial'].strftime(input_format)
+            kind = _get_initial_format_kind(initial.__class__)
+            if kind is not None:
+                if not input_formats:
+                    input_formats = list(_get_default_input_formats(kind))
 
-        return field_dict
+                initial = initial.strftime(input_formats[0])
+
+        field_dict['input_formats'] = input_formats
+        field_dict['initial'] = initial
 
 
 class RemoteDateField(RemoteTimeField):
-    def as_dict(self):
-        return super(RemoteDateField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteDateTimeField(RemoteTimeField):
-    def as_dict(self):
-        return super(RemoteDateTimeField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteRegexField(RemoteCharField):
-    def as_dict(self):
-        field_dict = super(RemoteRegexField, self).as_dict()
-
-        # We don't need the pattern object in the frontend
-        # field_dict['regex'] = self.field.regex
-
-        return field_dict
+    # We don't need the pattern object in the frontend
+    __slots__ = ()
 
 
 class RemoteEmailField(RemoteCharField):
-    def as_dict(self):
-        return super(RemoteEmailField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteFileField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteFileField, self).as_dict()
-
-        field_dict['max_length'] = self.field.max_length
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('max_length',)
 
 
 class RemoteImageField(RemoteFileField):
-    def as_dict(self):
-        return super(RemoteImageField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteURLField(RemoteCharField):
-    def as_dict(self):
-        return super(RemoteURLField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteBooleanField(RemoteField):
-    def as_dict(self):
-        return super(RemoteBooleanField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteNullBooleanField(RemoteBooleanField):
-    def as_dict(self):
-        return super(RemoteNullBooleanField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteChoiceField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteChoiceField, self).as_dict()
-
-        field_dict['choices'] = []
-        for key, value in self.field.choices:
-            field_dict['choices'].append({
-                'value': str(key),
-                'display': value
-            })
+    __slots__ = ()
 
-        return field_dict
+    def _post(self, field_dict: dict) -> None:
+        choices = self.field.choices
+        field_dict['choices'] = [{
+            'value': str(key),
+            'display': value
+        } for key, value in choices]
 
 
 class RemoteModelChoiceField(RemoteChoiceField):
-    def as_dict(self):
-        field_dict = super(RemoteModelChoiceField, self).as_dict()
-        field_dict['initial'] = getattr(field_dict['initial'], 'pk', field_dict['initial'])
-        return field_dict
-
+    # Choices keep going through the field's ModelChoiceIterator rather than
+    # queryset.values_list(): labels come from label_from_instance(), which
+    # is str(obj) by default and needs the model instance, and the iterator
+    # also takes care of empty_label and to_field_name.
+    __slots__ = ()
 
-class RemoteTypedChoiceField(RemoteChoiceField):
-    def as_dict(self):
-        field_dict = super(RemoteTypedChoiceField, self).as_dict()
+    def _post(self, field_dict: dict) -> None:
+        initial = field_dict['initial']
+        field_dict['initial'] = getattr(initial, 'pk', initial)
 
-        field_dict.update({
-            'coerce': self.field.coerce,
-            'empty_value': self.field.empty_value
-        })
 
-        return field_dict
+class RemoteTypedChoiceField(RemoteChoiceField):
+    __slots__ = ()
+    _extra_attrs = ('coerce', 'empty_value')
 
 
 class RemoteMultipleChoiceField(RemoteChoiceField):
-    def as_dict(self):
-        return super(RemoteMultipleChoiceField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteCommaSeparatedField(RemoteMultipleChoiceField):
-    def as_dict(self):
-
-        field_dict = super(RemoteCommaSeparatedField, self).as_dict()
-
-        if field_dict['initial']:
-            initial_list = field_dict['initial'].split(',')
+    __slots__ = ()
+
+    def _post(self, field_dict: dict) -> None:
+        initial = field_dict['initial']
+        if initial:
+            choices = field_dict['choices']
+            # Displays are compared as strings since grouped choices hold a
+            # list of options, which can't be hashed
+            seen = {(choice['value'], str(choice['display'])) for choice in choices}
+            validate_choices = self.field.validate_choices
+            initial_list = initial.split(',')
             for initial_value in initial_list:
-                display_value = f'{initial_value} (Not valid)' \
-                    if self.field.validate_choices else initial_value
-                initial_option = {
-                    'value': initial_value,
-                    'display': display_value,
-                }
-                if initial_option not in field_dict['choices']:
-                    field_dict['choices'].append(initial_option)
-
-        return field_dict
+                display_value = initial_value + ' (Not valid)' \
+                    if validate_choices else initial_value
+                key = (initial_value, display_value)
+                if key not in seen:
+                    seen.add(key)
+                    choices.append({
+                        'value': initial_value,
+                        'display': display_value,
+                    })
 
 
 class RemoteModelMultipleChoiceField(RemoteMultipleChoiceField):
-    def as_dict(self):
-        field_dict = super(RemoteModelMultipleChoiceField, self).as_dict()
-        if type(field_dict['initial']) is list:
-            field_dict['initial'] = [getattr(i, 'pk', i) for i in field_dict['initial']]
-        else:
-            field_dict['initial'] = getattr(field_dict['initial'], 'pk', field_dict['initial'])
+    __slots__ = ()
 
-        return field_dict
+    def _post(self, field_dict: dict) -> None:
+        initial = field_dict['initial']
+        if isinstance(initial, list):
+            field_dict['initial'] = [getattr(i, 'pk', i) for i in initial]
+        else:
+            field_dict['initial'] = getattr(initial, 'pk', initial)
 
 
 class RemoteTypedMultipleChoiceField(RemoteMultipleChoiceField):
-    def as_dict(self):
-        field_dict = super(RemoteTypedMultipleChoiceField, self).as_dict()
-
-        field_dict.update({
-            'coerce': self.field.coerce,
-            'empty_value': self.field.empty_value
-        })
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('coerce', 'empty_value')
 
 
 class RemoteComboField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteComboField, self).as_dict()
-
-        field_dict.update(fields=self.field.fields)
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('fields',)
 
 
 class RemoteMultiValueField(RemoteField):
-    def as_dict(self):
-        field_dict = super(RemoteMultiValueField, self).as_dict()
-
-        field_dict['fields'] = self.field.fields
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs: ClassVar[Tuple[str, ...]] = ('fields',)
 
 
 class RemoteFilePathField(RemoteChoiceField):
-    def as_dict(self):
-        field_dict = super(RemoteFilePathField, self).as_dict()
-
-        field_dict.update({
-            'path': self.field.path,
-            'match': self.field.match,
-            'recursive': self.field.recursive
-        })
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('path', 'match', 'recursive')
 
 
 class RemoteSplitDateTimeField(RemoteMultiValueField):
-    def as_dict(self):
-        field_dict = super(RemoteSplitDateTimeField, self).as_dict()
-
-        field_dict.update({
-            'input_date_formats': self.field.input_date_formats,
-            'input_time_formats': self.field.input_time_formats
-        })
-
-        return field_dict
+    __slots__ = ()
+    _extra_attrs = ('input_date_formats', 'input_time_formats')
 
 
 class RemoteIPAddressField(RemoteCharField):
-    def as_dict(self):
-        return super(RemoteIPAddressField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteGenericIPAddressField(RemoteCharField):
-    def as_dict(self):
-        return super(RemoteGenericIPAddressField, self).as_dict()
+    __slots__ = ()
 
 
 class RemoteSlugField(RemoteCharField):
-    def as_dict(self):
-        return super(RemoteSlugField, self).as_dict()
-
-
-class CommaSeparatedField(forms.MultipleChoiceField):
-
-    def __init__(self, *, validate_choices=True, **kwargs):
-        super().__init__(**kwargs)
-        # This argument allow disable the validation that checks if value is
-        # into field options. This is useful to allow the use of regex
-        # for example.
-        self.validate_choices = validate_choices
-
-    def prepare_value(self, value):
-        if type(value) == str:
-            value_list = value.split(',')
-            self.choices = list(self.choices)
-            [self.choices.append((v, f'{v} (Not valid)')) for v in value_list
-             if self.validate_choices and v and (v, v) not in self.choices]
-
-            return value_list
-        else:
-            return value
-
-    def valid_value(self, value: str) -> bool:
-        if self.validate_choices:
-            return super().valid_value(value)
-        return True
-
-    def clean(self, value):
-        value = super().clean(value)
-        return ','.join(value)
+    __slots__ = ()
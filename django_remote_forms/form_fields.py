@@ -0,0 +1,42 @@
+from django import forms
+
+
+class CommaSeparatedField(forms.MultipleChoiceField):
+
+    def __init__(self, *, validate_choices=True, **kwargs):
+        super().__init__(**kwargs)
+        # This argument allow disable the validation that checks if value is
+        # into field options. This is useful to allow the use of regex
+        # for example.
+        self.validate_choices = validate_choices
+
+    def prepare_value(self, value):
+        if isinstance(value, str):
+            value_list = value.split(',')
+            if self.validate_choices:
+                choices = list(self.choices)
+                # Grouped choices hold a list of options, which can't be hashed
+                existing = {tuple(choice) for choice in choices if not isinstance(choice[1], (list, tuple))}
+                added = False
+                for v in value_list:
+                    invalid_choice = (v, f'{v} (Not valid)')
+                    if v and (v, v) not in existing and invalid_choice not in existing:
+                        choices.append(invalid_choice)
+                        existing.add(invalid_choice)
+                        added = True
+
+                if added:
+                    self.choices = choices
+
+            return value_list
+        else:
+            return value
+
+    def valid_value(self, value: str) -> bool:
+        if self.validate_choices:
+            return super().valid_value(value)
+        return True
+
+    def clean(self, value):
+        value = super().clean(value)
+        return ','.join(value)
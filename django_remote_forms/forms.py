@@ -81,7 +81,7 @@ class RemoteForm(object):
             logger.warning('Following fieldset fields are excluded %s' % (fieldset_fields - set(self.fields)))
             self.fieldsets = {}
 
-    def as_dict(self, validated=True):
+    def as_dict(self, validated=True, include_widgets=True):
         """
         Returns a form as a dictionary that looks like the following:
 
@@ -107,6 +107,8 @@ class RemoteForm(object):
                 }
             }
         }
+
+        Field widgets are left out when include_widgets is False.
         """
         form_dict = OrderedDict()
         form_dict['title'] = self.form.__class__.__name__
@@ -158,7 +160,7 @@ class RemoteForm(object):
                 logger.warning('Error serializing field %s: %s', remote_field_class_name, str(e))
                 field_dict = {}
             else:
-                field_dict = remote_field.as_dict()
+                field_dict = remote_field.as_dict(include_widget=include_widgets)
 
             if name in self.readonly_fields:
                 field_dict['readonly'] = True
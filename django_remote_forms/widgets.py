@@ -9,6 +9,15 @@ class RemoteWidget(object):
         self.field_name = field_name
         self.widget = widget
 
+    # Serialize a widget without going through __init__, for callers that
+    # only need as_dict() once
+    @classmethod
+    def build_dict(cls, widget, field_name=None):
+        remote_widget = cls.__new__(cls)
+        remote_widget.widget = widget
+        remote_widget.field_name = field_name
+        return remote_widget.as_dict()
+
     def as_dict(self):
         widget_dict = OrderedDict()
         widget_dict['title'] = self.widget.__class__.__name__
@@ -175,12 +184,10 @@ class RemoteSelect(RemoteWidget):
     def as_dict(self):
         widget_dict = super(RemoteSelect, self).as_dict()
 
-        widget_dict['choices'] = []
-        for key, value in self.widget.choices:
-            widget_dict['choices'].append({
-                'value': str(key),
-                'display': value
-            })
+        widget_dict['choices'] = [{
+            'value': str(key),
+            'display': value
+        } for key, value in self.widget.choices]
 
         widget_dict['input_type'] = 'select'
 
@@ -238,13 +245,14 @@ class RemoteRadioSelect(RemoteSelect):
     def as_dict(self):
         widget_dict = super(RemoteRadioSelect, self).as_dict()
 
-        widget_dict['choices'] = []
-        for key, value in self.widget.choices:
-            widget_dict['choices'].append({
-                'name': self.field_name or '',
-                'value': str(key),
-                'display': value
-            })
+        # Reuse the choices built by RemoteSelect instead of iterating the
+        # widget choices again, which may hit the database
+        name = self.field_name or ''
+        widget_dict['choices'] = [{
+            'name': name,
+            'value': choice['value'],
+            'display': choice['display']
+        } for choice in widget_dict['choices']]
 
         widget_dict['input_type'] = 'radio'
 
@@ -7,6 +7,18 @@ except ImportError:
     use_setuptools()
     from setuptools import setup
 
+import os
+
+# The field serializers can optionally be compiled with mypyc by setting
+# DJANGO_REMOTE_FORMS_MYPYC=1; the pure Python modules are used otherwise.
+ext_modules = []
+if os.environ.get('DJANGO_REMOTE_FORMS_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        '--ignore-missing-imports',
+        'django_remote_forms/fields.py',
+    ])
+
 setup(
     name='django-remote-forms',
     version='0.0.1',
@@ -20,6 +32,7 @@ setup(
     ],
     package_data={
     },
+    ext_modules=ext_modules,
     zip_safe=False,
     requires=[
     ],